@@ -0,0 +1,29 @@
+"""
+Gunicorn settings for the SeaTrace ML API (Linux/macOS production serving).
+Run from the ml/ directory:  gunicorn -c gunicorn_conf.py api:app
+"""
+
+import gc
+import os
+from dotenv import load_dotenv
+
+load_dotenv()
+
+pythonpath = 'src'
+bind = f"0.0.0.0:{os.getenv('PORT', 5000)}"
+workers = int(os.getenv('WEB_CONCURRENCY', os.cpu_count() or 1))
+
+# Threaded workers: sklearn/NumPy inference releases the GIL for most of a
+# request, so a worker keeps serving while another request is in predict().
+worker_class = 'gthread'
+threads = int(os.getenv('GUNICORN_THREADS', 4))
+
+# Load the predictor once in the master; forked workers share its model
+# arrays copy-on-write instead of each loading (or training) their own.
+preload_app = True
+
+
+def when_ready(server):
+    # Park everything allocated while preloading in the permanent GC generation
+    # so collections in the workers don't write to (and un-share) those pages.
+    gc.freeze()
@@ -6,10 +6,11 @@ Flask API for ML predictions — All-India Coverage
 from flask import Flask, request, jsonify
 from flask_cors import CORS
 from predict import EnhancedHazardPredictor
-from data_engineering import AdvancedCoastalDataEngineer
 import os
+import time
+from functools import lru_cache
 from dotenv import load_dotenv
-from datetime import datetime
+from datetime import datetime, timedelta
 
 load_dotenv()
 
@@ -19,11 +20,29 @@ CORS(app)
 print("🚀 Initializing SeaTrace All-India ML Predictor...")
 predictor = EnhancedHazardPredictor()
 
+# Training is an offline step (python src/train.py); the API only serves saved models.
 if not predictor.is_trained:
-    print("⚠️  No trained models found. Training on expanded all-India dataset...")
-    engineer = AdvancedCoastalDataEngineer()
-    df = engineer.generate_expanded_dataset(samples_per_grid=3, temporal_sampling_rate=0.15)
-    predictor.train(df)
+    print("⚠️  No trained models found. Prediction routes return 503 until `python src/train.py` is run.")
+
+
+def _model_unavailable():
+    return jsonify({'error': 'Model not trained. Run `python src/train.py` first.'}), 503
+
+
+def _parse_query(data):
+    """Parse lat, lng and hazardType from a request body; ValueError if any is missing or malformed."""
+    if not data or 'lat' not in data or 'lng' not in data:
+        raise ValueError('Missing lat/lng')
+    hazard_type = data.get('hazardType', 'storm_surge')
+    if not isinstance(hazard_type, str):
+        raise ValueError('hazardType must be a string')
+    return float(data['lat']), float(data['lng']), hazard_type
+
+
+@lru_cache(maxsize=4096)
+def _cached_predict(lat_q: float, lng_q: float, hazard_type: str, hour: int):
+    """Memoized prediction; `hour` only rotates the key so entries go stale after an hour."""
+    return predictor.predict_risk(lat_q, lng_q, hazard_type)
 
 
 @app.route('/health', methods=['GET'])
@@ -36,22 +55,22 @@ def health():
         'hazardTypes': ['tsunami', 'cyclone', 'storm_surge', 'high_tide',
                         'coastal_flood', 'rip_current', 'erosion'],
         'features': 17,
+        'modelTrained': predictor.is_trained,
     })
 
 
 @app.route('/predict', methods=['POST'])
 def predict():
     """Single-location prediction."""
-    try:
-        data = request.get_json()
-        if not data or 'lat' not in data or 'lng' not in data:
-            return jsonify({'error': 'Missing lat/lng'}), 400
+    if not predictor.is_trained:
+        return _model_unavailable()
 
-        lat = float(data['lat'])
-        lng = float(data['lng'])
-        hazard_type = data.get('hazardType', 'storm_surge')
+    try:
+        data = request.get_json(silent=True)
+        lat, lng, hazard_type = _parse_query(data)
 
-        prediction = predictor.predict_risk(lat, lng, hazard_type)
+        hour = int(time.time() // 3600)
+        prediction = _cached_predict(round(lat, 3), round(lng, 3), hazard_type, hour)
         return jsonify(prediction)
 
     except ValueError as e:
@@ -63,6 +82,9 @@ def predict():
 @app.route('/predict/bulk', methods=['POST'])
 def predict_bulk():
     """Multi-location predictions."""
+    if not predictor.is_trained:
+        return _model_unavailable()
+
     try:
         data = request.get_json()
         if not data or 'locations' not in data:
@@ -82,21 +104,26 @@ def predict_timeline():
     Body: { lat, lng, hazardType, hours: 72 }
     Returns predictions at 6-hour intervals.
     """
+    if not predictor.is_trained:
+        return _model_unavailable()
+
     try:
-        data = request.get_json()
-        lat = float(data['lat'])
-        lng = float(data['lng'])
-        hazard_type = data.get('hazardType', 'storm_surge')
+        data = request.get_json(silent=True)
+        lat, lng, hazard_type = _parse_query(data)
         hours = int(data.get('hours', 72))
 
-        predictions = []
-        for h in range(0, hours, 6):
-            p = predictor.predict_risk(lat, lng, hazard_type)
+        offsets = list(range(0, hours, 6))
+        now = datetime.now()
+        predictions = predictor.predict_batch(
+            [lat] * len(offsets), [lng] * len(offsets), [hazard_type] * len(offsets),
+            [now + timedelta(hours=h) for h in offsets])
+        for p, h in zip(predictions, offsets):
             p['timeOffset_hours'] = h
-            predictions.append(p)
 
         return jsonify({'timeline': predictions, 'intervalHours': 6})
 
+    except ValueError as e:
+        return jsonify({'error': f'Invalid parameters: {str(e)}'}), 400
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
@@ -114,10 +141,13 @@ def model_info():
             if 'sea_region' in predictor.label_encoders else [],
         'trained': predictor.is_trained,
         'dataSource': 'INCOIS + IMD + NDMA calibrated all-India dataset',
+        'predictionCache': _cached_predict.cache_info()._asdict(),
     })
 
 
 if __name__ == '__main__':
+    # Serves with waitress (multi-threaded, works on Windows) unless DEBUG is set;
+    # Linux/macOS production runs under gunicorn (see gunicorn_conf.py)
     port = int(os.getenv('PORT', 5000))
     debug = os.getenv('DEBUG', 'False').lower() == 'true'
 
@@ -125,4 +155,8 @@ if __name__ == '__main__':
     print(f'📡 Port {port}')
     print(f'🗺️  Coverage: 12 states + 2 UTs, 70+ locations')
 
-    app.run(host='0.0.0.0', port=port, debug=debug)
+    if debug:
+        app.run(host='0.0.0.0', port=port, debug=True)
+    else:
+        from waitress import serve
+        serve(app, host='0.0.0.0', port=port, threads=int(os.getenv('WAITRESS_THREADS', 8)))
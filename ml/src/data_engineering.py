@@ -5,10 +5,257 @@ Temporal windowing, spatial gridding, oceanographic features, bathymetry
 
 import pandas as pd
 import numpy as np
-from datetime import datetime, timedelta
-from typing import Dict, List
-import random
-from itertools import product
+from numpy.random import default_rng, SFC64
+from functools import lru_cache
+from typing import Dict, Iterator, List
+from numba import njit, prange, void, float32, int8, boolean
+
+HAZARD_TYPES = ['tsunami', 'cyclone', 'storm_surge', 'high_tide',
+                'coastal_flood', 'rip_current', 'erosion']
+SEA_REGIONS = ['Bay of Bengal', 'Arabian Sea', 'Andaman Sea']
+SEASONS = ['winter', 'summer', 'monsoon', 'post_monsoon']
+
+HAZARD_IDX = {h: i for i, h in enumerate(HAZARD_TYPES)}
+REGION_IDX = {r: i for i, r in enumerate(SEA_REGIONS)}
+SEASON_IDX = {s: i for i, s in enumerate(SEASONS)}
+
+# Regional hazard weights (rows follow SEA_REGIONS, columns follow HAZARD_TYPES)
+HAZARD_WEIGHTS = np.array([
+    [0.05, 0.30, 0.25, 0.10, 0.10, 0.12, 0.08],  # Bay of Bengal
+    [0.02, 0.18, 0.22, 0.15, 0.15, 0.15, 0.13],  # Arabian Sea
+    [0.15, 0.18, 0.15, 0.08, 0.07, 0.25, 0.12],  # Andaman Sea
+])
+
+BASE_RISK = np.array([0.12, 0.35, 0.38, 0.28, 0.25, 0.30, 0.22])
+
+OCEAN_FEATURES = ['sst_celsius', 'wave_height_m', 'wind_speed_kmh',
+                  'current_velocity_ms', 'tide_level_m']
+
+# Hazard-specific perturbations: columns are sst, wave, wind, current, tide
+HAZARD_MULTIPLIERS = np.array([
+    [1.0, 3.0, 1.0, 5.0, 1.0],  # tsunami
+    [1.1, 2.0, 2.5, 1.0, 1.0],  # cyclone
+    [1.0, 1.5, 1.8, 1.0, 2.0],  # storm_surge
+    [1.0, 1.0, 1.0, 1.0, 1.5],  # high_tide
+    [1.0, 1.2, 1.0, 1.0, 1.3],  # coastal_flood
+    [1.0, 1.3, 1.0, 2.0, 1.0],  # rip_current
+    [1.0, 1.2, 1.0, 1.5, 1.0],  # erosion
+], dtype=np.float32)
+
+INTENSITY_BINS = ['very_low', 'low', 'moderate', 'high', 'very_high']
+SEVERITY_LEVELS = ['low', 'medium', 'high', 'critical']
+
+# Lower edges of every bin after the first; kept as tuples so Numba inlines them
+INTENSITY_EDGES = (0.2, 0.4, 0.6, 0.8)
+SEVERITY_EDGES = (0.25, 0.5, 0.75)
+INTENSITY_NAMES = np.array(INTENSITY_BINS)
+SEVERITY_NAMES = np.array(SEVERITY_LEVELS)
+_INTENSITY_EDGE_ARRAY = np.array(INTENSITY_EDGES)
+_SEVERITY_EDGE_ARRAY = np.array(SEVERITY_EDGES)
+
+WINDOW_EPOCH = np.datetime64('2023-01-01', 'D')
+
+# Seasonal risk multipliers: hazard -> sea region -> season
+SEASONAL_RISK_MATRIX = {
+    'tsunami': {
+        'Bay of Bengal': {'winter': 1.2, 'summer': 1.0, 'monsoon': 1.3, 'post_monsoon': 1.1},
+        'Arabian Sea': {'winter': 0.8, 'summer': 0.9, 'monsoon': 1.0, 'post_monsoon': 0.9},
+        'Andaman Sea': {'winter': 1.3, 'summer': 1.1, 'monsoon': 1.4, 'post_monsoon': 1.2},
+    },
+    'cyclone': {
+        'Bay of Bengal': {'winter': 0.5, 'summer': 1.2, 'monsoon': 1.8, 'post_monsoon': 1.6},
+        'Arabian Sea': {'winter': 0.3, 'summer': 1.5, 'monsoon': 1.4, 'post_monsoon': 1.0},
+        'Andaman Sea': {'winter': 0.6, 'summer': 1.0, 'monsoon': 1.5, 'post_monsoon': 1.3},
+    },
+    'storm_surge': {
+        'Bay of Bengal': {'winter': 0.6, 'summer': 1.0, 'monsoon': 1.7, 'post_monsoon': 1.3},
+        'Arabian Sea': {'winter': 0.5, 'summer': 0.9, 'monsoon': 1.5, 'post_monsoon': 1.1},
+        'Andaman Sea': {'winter': 0.5, 'summer': 0.8, 'monsoon': 1.3, 'post_monsoon': 1.0},
+    },
+    'high_tide': {
+        'Bay of Bengal': {'winter': 0.9, 'summer': 1.2, 'monsoon': 1.1, 'post_monsoon': 1.0},
+        'Arabian Sea': {'winter': 1.0, 'summer': 1.3, 'monsoon': 1.1, 'post_monsoon': 1.0},
+        'Andaman Sea': {'winter': 0.8, 'summer': 1.0, 'monsoon': 0.9, 'post_monsoon': 0.8},
+    },
+    'coastal_flood': {
+        'Bay of Bengal': {'winter': 0.7, 'summer': 0.9, 'monsoon': 1.6, 'post_monsoon': 1.2},
+        'Arabian Sea': {'winter': 0.6, 'summer': 0.8, 'monsoon': 1.5, 'post_monsoon': 1.0},
+        'Andaman Sea': {'winter': 0.5, 'summer': 0.7, 'monsoon': 1.3, 'post_monsoon': 0.9},
+    },
+    'rip_current': {
+        'Bay of Bengal': {'winter': 0.8, 'summer': 1.3, 'monsoon': 1.0, 'post_monsoon': 0.9},
+        'Arabian Sea': {'winter': 0.7, 'summer': 1.2, 'monsoon': 0.9, 'post_monsoon': 0.8},
+        'Andaman Sea': {'winter': 1.0, 'summer': 1.4, 'monsoon': 0.8, 'post_monsoon': 0.9},
+    },
+    'erosion': {
+        'Bay of Bengal': {'winter': 0.8, 'summer': 0.9, 'monsoon': 1.5, 'post_monsoon': 1.2},
+        'Arabian Sea': {'winter': 0.7, 'summer': 0.8, 'monsoon': 1.4, 'post_monsoon': 1.1},
+        'Andaman Sea': {'winter': 0.6, 'summer': 0.7, 'monsoon': 1.2, 'post_monsoon': 0.9},
+    },
+}
+
+
+def _seasonal_risk_lut() -> np.ndarray:
+    """Dense (hazard, region, season) view of SEASONAL_RISK_MATRIX; unlisted combinations are 1.0"""
+    lut = np.ones((len(HAZARD_TYPES), len(SEA_REGIONS), len(SEASONS)), dtype=np.float32)
+    for hazard_type, regions in SEASONAL_RISK_MATRIX.items():
+        for sea_region, seasons in regions.items():
+            for season, risk in seasons.items():
+                lut[HAZARD_IDX[hazard_type], REGION_IDX[sea_region], SEASON_IDX[season]] = risk
+    lut.setflags(write=False)
+    return lut
+
+
+SEASONAL_RISK_LUT = _seasonal_risk_lut()
+
+# Seasonal (sst, wave, wind) base values
+OCEAN_BASE_MONSOON = (29.0, 3.5, 25.0)
+OCEAN_BASE_WINTER = (26.5, 1.5, 12.0)
+OCEAN_BASE_SUMMER = (30.5, 2.0, 15.0)  # Summer/Pre-monsoon
+
+# Regional (sst, wave, wind) deltas, rows follow SEA_REGIONS
+# (Arabian Sea: generally calmer except monsoon)
+OCEAN_REGION_DELTA = np.array([
+    [0.5, 0.3, 0.0],  # Bay of Bengal
+    [0.0, 0.0, 0.0],  # Arabian Sea
+    [1.0, 0.5, 0.0],  # Andaman Sea
+], dtype=np.float32)
+
+
+# Noise scale per draw: sst, wave, wind, current, tide (Gujarat), tide (elsewhere), tide jitter
+OCEAN_NOISE_SCALES = np.array([0.5, 0.3, 3.0, 0.2, 1.0, 0.3, 0.3], dtype=np.float32)
+
+
+@njit(void(int8[:], int8[:], int8[:], float32[:], boolean[:], float32[:, ::1],
+           float32[:, :, ::1], float32[:, ::1], float32[::1], float32[::1],
+           float32[:], float32[:], float32[:], float32[:], float32[:]),
+      parallel=True, cache=True, fastmath=True)
+def _ocean_kernel(month, region_idx, hazard_idx, lat_offset, is_gujarat, noise,
+                  base_lut, mult_lut, lo, hi, sst, wave, wind, current, tide):
+    """Fused base lookup, hazard multiplier, noise and clip for the five ocean features."""
+    for i in prange(month.shape[0]):
+        b = base_lut[month[i] - 1, region_idx[i]]
+        m = mult_lut[hazard_idx[i]]
+
+        # Latitude variation (warmer near equator) is precomputed per grid cell
+        v = (b[0] + lat_offset[i]) * m[0] + noise[0, i]
+        sst[i] = min(max(v, lo[0]), hi[0])
+
+        v = b[1] * m[1] + noise[1, i]
+        wave[i] = min(max(v, lo[1]), hi[1])
+
+        v = b[2] * m[2] + noise[2, i]
+        wind[i] = min(max(v, lo[2]), hi[2])
+
+        v = m[3] * np.float32(0.5) + noise[3, i]
+        current[i] = min(max(v, lo[3]), hi[3])
+
+        # Gujarat tidal extremes
+        if is_gujarat[i]:
+            v = np.float32(4.0) + noise[4, i]
+        else:
+            v = np.float32(0.8) + noise[5, i]
+        v = v * m[4] + noise[6, i]
+        tide[i] = min(max(v, lo[4]), hi[4])
+
+
+@njit(void(float32[:], float32[:], float32[:], float32[:], float32[:], float32[:],
+           float32[:], float32[:], float32[:], int8[:], int8[:]),
+      parallel=True, cache=True, fastmath=True)
+def _score_kernel(sst, wave, wind, bathy, slope, base_risk, seasonal_risk, noise,
+                  out_risk, out_bin, out_sev):
+    """Risk score, intensity bin index and severity index for every sample."""
+    for i in prange(sst.shape[0]):
+        ocean_risk_factor = (sst[i] / 30.0) * 0.25 + (wave[i] / 4.0) * 0.35 + (wind[i] / 35.0) * 0.25
+        if bathy[i] < 30:
+            ocean_risk_factor += 0.08
+        if slope[i] > 3:
+            ocean_risk_factor += 0.07
+
+        risk = base_risk[i] * seasonal_risk[i] * (0.7 + ocean_risk_factor * 0.6) + noise[i]
+        risk = min(max(risk, 0.0), 1.0)
+        out_risk[i] = risk
+
+        b = 0
+        for edge in INTENSITY_EDGES:
+            if risk >= edge:
+                b += 1
+        out_bin[i] = b
+
+        sv = 0
+        for edge in SEVERITY_EDGES:
+            if risk >= edge:
+                sv += 1
+        out_sev[i] = sv
+
+
+def _grid_block(lats: np.ndarray, lngs: np.ndarray):
+    """Flattened (lat, lng) cell centres of a rectangular block, row-major by latitude."""
+    lat_c, lng_c = np.meshgrid(lats, lngs, indexing='ij')
+    return lat_c.ravel(), lng_c.ravel()
+
+
+# The grid and calendar are fixed, so they are built once per process and
+# shared (read-only) by every engineer instance.
+@lru_cache(maxsize=None)
+def _build_spatial_grid():
+    # Bay of Bengal coast (Tamil Nadu to West Bengal): lat 8-23, lng 77-90 (east of 77)
+    bob_lat, bob_lng = _grid_block(np.arange(8.0, 23.0, 0.5), np.arange(77.5, 90.0, 0.5))
+
+    # Arabian Sea coast (Kerala to Gujarat): lat 8-24, lng 66-77 (west of 77)
+    as_lat, as_lng = _grid_block(np.arange(8.0, 24.0, 0.5), np.arange(66.0, 77.0, 0.5))
+
+    # Andaman Sea (Andaman & Nicobar): lat 6-14, lng 91-94
+    and_lat, and_lng = _grid_block(np.arange(6.0, 14.0, 0.5), np.arange(91.0, 94.5, 0.5))
+
+    grid = (
+        np.concatenate([bob_lat, as_lat, and_lat], dtype=np.float32),
+        np.concatenate([bob_lng, as_lng, and_lng], dtype=np.float32),
+        np.concatenate([
+            np.full(len(bob_lat), REGION_IDX['Bay of Bengal'], dtype=np.int8),
+            np.full(len(as_lat), REGION_IDX['Arabian Sea'], dtype=np.int8),
+            np.full(len(and_lat), REGION_IDX['Andaman Sea'], dtype=np.int8),
+        ]),
+        np.array(
+            [f'BOB_{i:04d}' for i in range(len(bob_lat))] +
+            [f'AS_{i:04d}' for i in range(len(as_lat))] +
+            [f'AND_{i:04d}' for i in range(len(and_lat))], dtype=object),
+    )
+    for arr in grid:
+        arr.setflags(write=False)
+    return grid
+
+
+def _get_season(month: int) -> str:
+    if month in [12, 1, 2]: return 'winter'
+    elif month in [3, 4, 5]: return 'summer'
+    elif month in [6, 7, 8, 9]: return 'monsoon'
+    else: return 'post_monsoon'
+
+
+@lru_cache(maxsize=None)
+def _build_temporal_windows():
+    # Windows are stored as int32 day offsets from WINDOW_EPOCH; calendar
+    # columns are derived with datetime64 arithmetic instead of datetime objects.
+    day_offset = np.arange(730, dtype=np.int32)
+    dates = WINDOW_EPOCH + day_offset.astype('timedelta64[D]')
+    years = dates.astype('datetime64[Y]')
+    month = (dates.astype('datetime64[M]').astype(np.int64) % 12 + 1).astype(np.int8)
+    month_season = np.array([SEASON_IDX[_get_season(m)] for m in range(1, 13)], dtype=np.int8)
+
+    windows = {
+        'day_offset': day_offset,
+        'year': (years.astype(np.int64) + 1970).astype(np.int16),
+        'month': month,
+        'day_of_year': ((dates - years).astype(np.int64) + 1).astype(np.int16),
+        'season_idx': month_season[month - 1],
+        'is_monsoon': np.isin(month, [6, 7, 8, 9]),
+        'is_cyclone_season': np.isin(month, [4, 5, 10, 11, 12]),
+    }
+    for arr in windows.values():
+        arr.setflags(write=False)
+    return windows
+
 
 class AdvancedCoastalDataEngineer:
     """
@@ -16,8 +263,10 @@ class AdvancedCoastalDataEngineer:
     Features: temporal windowing, spatial gridding, oceanographic + geological features.
     """
 
-    def __init__(self):
-        self.grid_cells = self._create_spatial_grid()
+    def __init__(self, seed: int = 42, verbose: bool = True):
+        self.rng = default_rng(SFC64(seed))
+        self.verbose = verbose
+        self._create_spatial_grid()
         self.temporal_windows = self._create_temporal_windows()
 
         # Oceanographic feature ranges (calibrated from INCOIS buoy data)
@@ -29,308 +278,232 @@ class AdvancedCoastalDataEngineer:
             'tide_level': (-1.0, 6.0),  # Extended for Gulf of Khambhat
         }
 
-        self.intensity_bins = {
-            'very_low': (0.0, 0.2),
-            'low': (0.2, 0.4),
-            'moderate': (0.4, 0.6),
-            'high': (0.6, 0.8),
-            'very_high': (0.8, 1.0),
-        }
+        self._ocean_lo = np.array([lo for lo, _ in self.oceanographic_ranges.values()], dtype=np.float32)
+        self._ocean_hi = np.array([hi for _, hi in self.oceanographic_ranges.values()], dtype=np.float32)
+
+        self.hazard_cum = np.cumsum(HAZARD_WEIGHTS, axis=1, dtype=np.float32)
+        self.hazard_cum[:, -1] = 1.0
+
+        # (sst, wave, wind) base per (month - 1, region)
+        self._month_region_base = np.zeros((12, len(SEA_REGIONS), 3), dtype=np.float32)
+        for month in range(1, 13):
+            if month in [6, 7, 8, 9]:
+                base = OCEAN_BASE_MONSOON
+            elif month in [12, 1, 2]:
+                base = OCEAN_BASE_WINTER
+            else:
+                base = OCEAN_BASE_SUMMER
+            self._month_region_base[month - 1] = np.asarray(base, dtype=np.float32) + OCEAN_REGION_DELTA
 
-    def _create_spatial_grid(self) -> List[Dict]:
+    def _create_spatial_grid(self) -> None:
         """
         Create spatial grid cells covering ENTIRE Indian coastline.
         Covers: Bay of Bengal, Arabian Sea, Andaman Sea.
+        Cells are stored column-wise in grid_lat, grid_lng, grid_region_idx, grid_cell_id.
         """
-        grid_cells = []
-        cell_id = 0
-
-        # Bay of Bengal coast (Tamil Nadu to West Bengal): lat 8-23, lng 77-90
-        for lat in np.arange(8.0, 23.0, 0.5):
-            for lng in np.arange(77.0, 90.0, 0.5):
-                if lng > 77:
-                    grid_cells.append({
-                        'cell_id': f'BOB_{cell_id:04d}',
-                        'lat_center': lat, 'lng_center': lng,
-                        'lat_min': lat - 0.25, 'lat_max': lat + 0.25,
-                        'lng_min': lng - 0.25, 'lng_max': lng + 0.25,
-                        'sea_region': 'Bay of Bengal',
-                    })
-                    cell_id += 1
-
-        # Arabian Sea coast (Kerala to Gujarat): lat 8-24, lng 66-77
-        cell_id = 0
-        for lat in np.arange(8.0, 24.0, 0.5):
-            for lng in np.arange(66.0, 77.5, 0.5):
-                if lng < 77:
-                    grid_cells.append({
-                        'cell_id': f'AS_{cell_id:04d}',
-                        'lat_center': lat, 'lng_center': lng,
-                        'lat_min': lat - 0.25, 'lat_max': lat + 0.25,
-                        'lng_min': lng - 0.25, 'lng_max': lng + 0.25,
-                        'sea_region': 'Arabian Sea',
-                    })
-                    cell_id += 1
-
-        # Andaman Sea (Andaman & Nicobar): lat 6-14, lng 91-94
-        cell_id = 0
-        for lat in np.arange(6.0, 14.0, 0.5):
-            for lng in np.arange(91.0, 94.5, 0.5):
-                grid_cells.append({
-                    'cell_id': f'AND_{cell_id:04d}',
-                    'lat_center': lat, 'lng_center': lng,
-                    'lat_min': lat - 0.25, 'lat_max': lat + 0.25,
-                    'lng_min': lng - 0.25, 'lng_max': lng + 0.25,
-                    'sea_region': 'Andaman Sea',
-                })
-                cell_id += 1
-
-        print(f"[GRID] Created {len(grid_cells)} spatial grid cells (BoB + AS + Andaman)")
-        return grid_cells
-
-    def _create_temporal_windows(self) -> List[Dict]:
-        """Create 2 years of daily temporal windows."""
-        windows = []
-        start_date = datetime(2023, 1, 1)
-
-        for day_offset in range(730):
-            timestamp = start_date + timedelta(days=day_offset)
-            windows.append({
-                'timestamp': timestamp,
-                'year': timestamp.year,
-                'month': timestamp.month,
-                'day': timestamp.day,
-                'day_of_year': timestamp.timetuple().tm_yday,
-                'season': self._get_season(timestamp.month),
-                'is_monsoon': timestamp.month in [6, 7, 8, 9],
-                'is_cyclone_season': timestamp.month in [4, 5, 10, 11, 12],
-            })
-
-        print(f"[TIME] Created {len(windows)} temporal windows (2 years daily)")
+        self.grid_lat, self.grid_lng, self.grid_region_idx, self.grid_cell_id = _build_spatial_grid()
+        if self.verbose:
+            print(f"[GRID] Created {len(self.grid_lat)} spatial grid cells (BoB + AS + Andaman)")
+
+    @property
+    def grid_cells(self) -> List[Dict]:
+        """Row-wise (list of dicts) view of the grid, built on demand for callers that iterate cells."""
+        return [{
+            'cell_id': cell_id,
+            'lat_center': lat, 'lng_center': lng,
+            'lat_min': lat - 0.25, 'lat_max': lat + 0.25,
+            'lng_min': lng - 0.25, 'lng_max': lng + 0.25,
+            'sea_region': SEA_REGIONS[region],
+        } for cell_id, lat, lng, region in zip(
+            self.grid_cell_id, self.grid_lat.tolist(), self.grid_lng.tolist(), self.grid_region_idx.tolist())]
+
+    def _create_temporal_windows(self) -> Dict[str, np.ndarray]:
+        """Create 2 years of daily temporal windows, stored column-wise."""
+        windows = _build_temporal_windows()
+        if self.verbose:
+            print(f"[TIME] Created {len(windows['day_offset'])} temporal windows (2 years daily)")
         return windows
 
     def _get_season(self, month: int) -> str:
-        if month in [12, 1, 2]: return 'winter'
-        elif month in [3, 4, 5]: return 'summer'
-        elif month in [6, 7, 8, 9]: return 'monsoon'
-        else: return 'post_monsoon'
-
-    def _generate_oceanographic_features(self, lat, lng, timestamp, hazard_type, sea_region) -> Dict:
-        """Generate realistic oceanographic features varying by region, season, and hazard."""
-        month = timestamp.month
-
-        # Base values by season
-        if month in [6, 7, 8, 9]:  # Monsoon
-            sst_base, wave_base, wind_base = 29.0, 3.5, 25.0
-        elif month in [12, 1, 2]:  # Winter
-            sst_base, wave_base, wind_base = 26.5, 1.5, 12.0
-        else:  # Summer/Pre-monsoon
-            sst_base, wave_base, wind_base = 30.5, 2.0, 15.0
-
-        # Regional variation
-        if sea_region == 'Bay of Bengal':
-            sst_base += 0.5; wave_base += 0.3
-        elif sea_region == 'Andaman Sea':
-            sst_base += 1.0; wave_base += 0.5
-        # Arabian Sea: generally calmer except monsoon
-
-        # Latitude variation (warmer near equator)
-        sst_base += (12.0 - lat) * 0.05
+        return _get_season(month)
 
-        # Gujarat tidal extremes
-        if sea_region == 'Arabian Sea' and lat > 20:
-            tide_base = 4.0 + np.random.normal(0, 1.0)
-        else:
-            tide_base = 0.8 + np.random.normal(0, 0.3)
-
-        # Hazard-specific perturbations
-        multipliers = {
-            'tsunami': {'wave': 3.0, 'current': 5.0},
-            'cyclone': {'wind': 2.5, 'wave': 2.0, 'sst': 1.1},
-            'storm_surge': {'tide': 2.0, 'wind': 1.8, 'wave': 1.5},
-            'high_tide': {'tide': 1.5},
-            'coastal_flood': {'tide': 1.3, 'wave': 1.2},
-            'rip_current': {'current': 2.0, 'wave': 1.3},
-            'erosion': {'wave': 1.2, 'current': 1.5},
-        }
-        m = multipliers.get(hazard_type, {})
-
-        features = {
-            'sst_celsius': np.clip(sst_base * m.get('sst', 1.0) + np.random.normal(0, 0.5), *self.oceanographic_ranges['sst']),
-            'wave_height_m': np.clip(wave_base * m.get('wave', 1.0) + np.random.normal(0, 0.3), *self.oceanographic_ranges['wave_height']),
-            'wind_speed_kmh': np.clip(wind_base * m.get('wind', 1.0) + np.random.normal(0, 3.0), *self.oceanographic_ranges['wind_speed']),
-            'current_velocity_ms': np.clip(0.5 * m.get('current', 1.0) + np.random.normal(0, 0.2), *self.oceanographic_ranges['current_velocity']),
-            'tide_level_m': np.clip(tide_base * m.get('tide', 1.0) + np.random.normal(0, 0.3), *self.oceanographic_ranges['tide_level']),
-        }
-        return features
+    def _normal(self, scale: float, n: int) -> np.ndarray:
+        return self.rng.standard_normal(n, dtype=np.float32) * np.float32(scale)
+
+    def _generate_oceanographic_features(self, month, region_idx, hazard_idx, lat_offset, is_gujarat,
+                                         sst, wave, wind, current, tide) -> None:
+        """
+        Generate realistic oceanographic features varying by region, season, and hazard.
+        Index arrays select month/region/hazard per sample; results are written
+        into the preallocated float32 buffers sst, wave, wind, current and tide.
+        """
+        # Draw order (sst, wave, wind, current, tide x3) matches OCEAN_NOISE_SCALES
+        noise = self.rng.standard_normal((len(OCEAN_NOISE_SCALES), len(month)), dtype=np.float32)
+        noise *= OCEAN_NOISE_SCALES[:, None]
+        _ocean_kernel(month, region_idx, hazard_idx, lat_offset, is_gujarat, noise,
+                      self._month_region_base, HAZARD_MULTIPLIERS, self._ocean_lo, self._ocean_hi,
+                      sst, wave, wind, current, tide)
+
+    def _generate_geological_features(self, cells: np.ndarray) -> Dict:
+        """Generate bathymetry, coastal slope, and tidal range features for an array of grid cells."""
+        n = len(cells)
+        lat = self.grid_lat[cells]
+        region_idx = self.grid_region_idx[cells]
+
+        mask_gujarat = (region_idx == REGION_IDX['Arabian Sea']) & (lat > 20)
+        mask_andaman = region_idx == REGION_IDX['Andaman Sea']
+        mask_bengal = (region_idx == REGION_IDX['Bay of Bengal']) & (lat > 20)
 
-    def _generate_geological_features(self, lat, lng, sea_region) -> Dict:
-        """Generate bathymetry, coastal slope, and tidal range features."""
         # Bathymetry (continental shelf depth)
-        if sea_region == 'Arabian Sea' and lat > 20:  # Gujarat - wide shallow shelf
-            bathymetry = random.uniform(5, 30)
-        elif sea_region == 'Andaman Sea':  # Deep waters
-            bathymetry = random.uniform(50, 300)
-        elif sea_region == 'Bay of Bengal' and lat > 20:  # Bengal shelf
-            bathymetry = random.uniform(10, 40)
-        else:
-            bathymetry = random.uniform(15, 100)
+        bathymetry = np.select(
+            [mask_gujarat, mask_andaman, mask_bengal],
+            [self.rng.uniform(5, 30, n),      # Gujarat - wide shallow shelf
+             self.rng.uniform(50, 300, n),    # Deep waters
+             self.rng.uniform(10, 40, n)],    # Bengal shelf
+            default=self.rng.uniform(15, 100, n))
 
         # Coastal slope
-        coastal_slope = random.uniform(0.5, 5.0)
+        coastal_slope = self.rng.uniform(0.5, 5.0, n)
 
         # Tidal range (Gujarat >> rest of India)
-        if sea_region == 'Arabian Sea' and lat > 20:
-            tidal_range = random.uniform(6.0, 11.0)
-        elif sea_region == 'Bay of Bengal' and lat > 20:
-            tidal_range = random.uniform(3.0, 6.0)
-        else:
-            tidal_range = random.uniform(0.5, 2.5)
+        tidal_range = np.select(
+            [mask_gujarat, mask_bengal],
+            [self.rng.uniform(6.0, 11.0, n), self.rng.uniform(3.0, 6.0, n)],
+            default=self.rng.uniform(0.5, 2.5, n))
 
         return {
-            'bathymetry_depth_m': round(bathymetry, 1),
-            'coastal_slope_deg': round(coastal_slope, 2),
-            'tidal_range_m': round(tidal_range, 2),
+            'bathymetry_depth_m': np.round(bathymetry, 1).astype(np.float32),
+            'coastal_slope_deg': np.round(coastal_slope, 2).astype(np.float32),
+            'tidal_range_m': np.round(tidal_range, 2).astype(np.float32),
         }
 
-    def _calculate_intensity_bin(self, risk_score: float) -> str:
-        for bin_name, (min_val, max_val) in self.intensity_bins.items():
-            if min_val <= risk_score < max_val:
-                return bin_name
-        return 'very_high'
+    def _calculate_intensity_bin(self, risk_score):
+        """Map a risk score (or array of scores) to its intensity bin name(s)"""
+        return INTENSITY_NAMES[np.searchsorted(_INTENSITY_EDGE_ARRAY, risk_score, side='right')]
+
+    def _calculate_severity(self, risk_score):
+        """Map a risk score (or array of scores) to its severity level(s)"""
+        return SEVERITY_NAMES[np.searchsorted(_SEVERITY_EDGE_ARRAY, risk_score, side='right')]
 
     def _calculate_seasonal_risk(self, hazard_type, season, sea_region) -> float:
-        risk_matrix = {
-            'tsunami': {
-                'Bay of Bengal': {'winter': 1.2, 'summer': 1.0, 'monsoon': 1.3, 'post_monsoon': 1.1},
-                'Arabian Sea': {'winter': 0.8, 'summer': 0.9, 'monsoon': 1.0, 'post_monsoon': 0.9},
-                'Andaman Sea': {'winter': 1.3, 'summer': 1.1, 'monsoon': 1.4, 'post_monsoon': 1.2},
-            },
-            'cyclone': {
-                'Bay of Bengal': {'winter': 0.5, 'summer': 1.2, 'monsoon': 1.8, 'post_monsoon': 1.6},
-                'Arabian Sea': {'winter': 0.3, 'summer': 1.5, 'monsoon': 1.4, 'post_monsoon': 1.0},
-                'Andaman Sea': {'winter': 0.6, 'summer': 1.0, 'monsoon': 1.5, 'post_monsoon': 1.3},
-            },
-            'storm_surge': {
-                'Bay of Bengal': {'winter': 0.6, 'summer': 1.0, 'monsoon': 1.7, 'post_monsoon': 1.3},
-                'Arabian Sea': {'winter': 0.5, 'summer': 0.9, 'monsoon': 1.5, 'post_monsoon': 1.1},
-                'Andaman Sea': {'winter': 0.5, 'summer': 0.8, 'monsoon': 1.3, 'post_monsoon': 1.0},
-            },
-            'high_tide': {
-                'Bay of Bengal': {'winter': 0.9, 'summer': 1.2, 'monsoon': 1.1, 'post_monsoon': 1.0},
-                'Arabian Sea': {'winter': 1.0, 'summer': 1.3, 'monsoon': 1.1, 'post_monsoon': 1.0},
-                'Andaman Sea': {'winter': 0.8, 'summer': 1.0, 'monsoon': 0.9, 'post_monsoon': 0.8},
-            },
-            'coastal_flood': {
-                'Bay of Bengal': {'winter': 0.7, 'summer': 0.9, 'monsoon': 1.6, 'post_monsoon': 1.2},
-                'Arabian Sea': {'winter': 0.6, 'summer': 0.8, 'monsoon': 1.5, 'post_monsoon': 1.0},
-                'Andaman Sea': {'winter': 0.5, 'summer': 0.7, 'monsoon': 1.3, 'post_monsoon': 0.9},
-            },
-            'rip_current': {
-                'Bay of Bengal': {'winter': 0.8, 'summer': 1.3, 'monsoon': 1.0, 'post_monsoon': 0.9},
-                'Arabian Sea': {'winter': 0.7, 'summer': 1.2, 'monsoon': 0.9, 'post_monsoon': 0.8},
-                'Andaman Sea': {'winter': 1.0, 'summer': 1.4, 'monsoon': 0.8, 'post_monsoon': 0.9},
-            },
-            'erosion': {
-                'Bay of Bengal': {'winter': 0.8, 'summer': 0.9, 'monsoon': 1.5, 'post_monsoon': 1.2},
-                'Arabian Sea': {'winter': 0.7, 'summer': 0.8, 'monsoon': 1.4, 'post_monsoon': 1.1},
-                'Andaman Sea': {'winter': 0.6, 'summer': 0.7, 'monsoon': 1.2, 'post_monsoon': 0.9},
-            },
+        if hazard_type in HAZARD_IDX and sea_region in REGION_IDX and season in SEASON_IDX:
+            return round(float(SEASONAL_RISK_LUT[HAZARD_IDX[hazard_type], REGION_IDX[sea_region], SEASON_IDX[season]]), 3)
+        return 1.0
+
+    def iter_expanded_chunks(self, samples_per_grid=3, temporal_sampling_rate=0.15,
+                             grids_per_chunk=None, verbose=None) -> Iterator[pd.DataFrame]:
+        """
+        Yield the expanded dataset as DataFrames of `grids_per_chunk` grid cells each
+        (all sampled cells in one frame when None). Chunks share categories, so they
+        concatenate or stream to Parquet without re-encoding.
+        """
+        verbose = self.verbose if verbose is None else verbose
+        n_cells = len(self.grid_lat)
+        sampled_grids = self.rng.choice(n_cells, size=min(150, n_cells), replace=False)
+        n_all_windows = len(self.temporal_windows['day_offset'])
+        window_sel = self.rng.choice(n_all_windows, size=int(n_all_windows * temporal_sampling_rate), replace=False)
+
+        if verbose:
+            print(f"\n[CONFIG] Dataset Configuration:")
+            print(f"   Spatial grid cells: {len(sampled_grids)}")
+            print(f"   Temporal windows: {len(window_sel)}")
+            print(f"   Samples per grid: {samples_per_grid}")
+            print(f"   Expected samples: ~{len(sampled_grids) * len(window_sel) * samples_per_grid:,}")
+
+        n_grids, n_windows = len(sampled_grids), len(window_sel)
+        cell_ids = self.grid_cell_id[sampled_grids]
+
+        # Per-grid columns (geological features are drawn once per grid cell)
+        grid_cols = {
+            'lat': self.grid_lat[sampled_grids],
+            'lng': self.grid_lng[sampled_grids],
+            'region_idx': self.grid_region_idx[sampled_grids],
+            **self._generate_geological_features(sampled_grids),
         }
-        return risk_matrix.get(hazard_type, {}).get(sea_region, {}).get(season, 1.0)
-
-    def generate_expanded_dataset(self, samples_per_grid=3, temporal_sampling_rate=0.15) -> pd.DataFrame:
-        """Generate massively expanded all-India training dataset."""
-        print("\n" + "=" * 70)
-        print("[DATA ENGINEERING] All-India Advanced Data Pipeline")
-        print("=" * 70)
-
-        sampled_grids = random.sample(self.grid_cells, min(150, len(self.grid_cells)))
-        sampled_windows = random.sample(self.temporal_windows,
-                                       int(len(self.temporal_windows) * temporal_sampling_rate))
-
-        print(f"\n[CONFIG] Dataset Configuration:")
-        print(f"   Spatial grid cells: {len(sampled_grids)}")
-        print(f"   Temporal windows: {len(sampled_windows)}")
-        print(f"   Samples per grid: {samples_per_grid}")
-        print(f"   Expected samples: ~{len(sampled_grids) * len(sampled_windows) * samples_per_grid:,}")
-
-        dataset = []
-        hazard_types = ['tsunami', 'cyclone', 'storm_surge', 'high_tide',
-                        'coastal_flood', 'rip_current', 'erosion']
-
-        print("\n[GENERATING] Generating samples...")
-        for grid in sampled_grids:
-            sea_region = grid['sea_region']
-            geo_features = self._generate_geological_features(
-                grid['lat_center'], grid['lng_center'], sea_region)
-
-            for window in sampled_windows:
-                for _ in range(samples_per_grid):
-                    # Regional hazard weights
-                    if sea_region == 'Bay of Bengal':
-                        weights = [0.05, 0.30, 0.25, 0.10, 0.10, 0.12, 0.08]
-                    elif sea_region == 'Andaman Sea':
-                        weights = [0.15, 0.18, 0.15, 0.08, 0.07, 0.25, 0.12]
-                    else:
-                        weights = [0.02, 0.18, 0.22, 0.15, 0.15, 0.15, 0.13]
-
-                    hazard_type = np.random.choice(hazard_types, p=weights)
-
-                    ocean_features = self._generate_oceanographic_features(
-                        grid['lat_center'], grid['lng_center'],
-                        window['timestamp'], hazard_type, sea_region)
-
-                    seasonal_risk = self._calculate_seasonal_risk(
-                        hazard_type, window['season'], sea_region)
-
-                    base_risk = {
-                        'tsunami': 0.12, 'cyclone': 0.35, 'storm_surge': 0.38,
-                        'high_tide': 0.28, 'coastal_flood': 0.25,
-                        'rip_current': 0.30, 'erosion': 0.22,
-                    }[hazard_type]
-
-                    ocean_risk_factor = (
-                        (ocean_features['sst_celsius'] / 30.0) * 0.25 +
-                        (ocean_features['wave_height_m'] / 4.0) * 0.35 +
-                        (ocean_features['wind_speed_kmh'] / 35.0) * 0.25 +
-                        (geo_features['bathymetry_depth_m'] < 30) * 0.08 +
-                        (geo_features['coastal_slope_deg'] > 3) * 0.07
-                    )
-
-                    final_risk = np.clip(
-                        base_risk * seasonal_risk * (0.7 + ocean_risk_factor * 0.6) +
-                        np.random.normal(0, 0.05), 0.0, 1.0)
-
-                    intensity_bin = self._calculate_intensity_bin(final_risk)
-                    if final_risk >= 0.75: severity = 'critical'
-                    elif final_risk >= 0.5: severity = 'high'
-                    elif final_risk >= 0.25: severity = 'medium'
-                    else: severity = 'low'
-
-                    sample = {
-                        'cell_id': grid['cell_id'],
-                        'lat': grid['lat_center'],
-                        'lng': grid['lng_center'],
-                        'sea_region': sea_region,
-                        'timestamp': window['timestamp'],
-                        'year': window['year'],
-                        'month': window['month'],
-                        'day_of_year': window['day_of_year'],
-                        'season': window['season'],
-                        'is_monsoon': window['is_monsoon'],
-                        'is_cyclone_season': window['is_cyclone_season'],
-                        **ocean_features,
-                        **geo_features,
-                        'hazard_type': hazard_type,
-                        'risk_score': round(final_risk, 4),
-                        'seasonal_risk_multiplier': round(seasonal_risk, 3),
-                        'severity': severity,
-                        'intensity_bin': intensity_bin,
-                    }
-                    dataset.append(sample)
-
-        df = pd.DataFrame(dataset)
+        grid_cols['lat_offset'] = (0.05 * (12.0 - grid_cols['lat'])).astype(np.float32)
+        grid_cols['is_gujarat'] = (grid_cols['region_idx'] == REGION_IDX['Arabian Sea']) & (grid_cols['lat'] > 20)
+
+        # Per-window columns
+        window_cols = {k: v[window_sel] for k, v in self.temporal_windows.items()}
+        window_cols['timestamp'] = (WINDOW_EPOCH + window_cols.pop('day_offset').astype('timedelta64[D]')
+                                    ).astype('datetime64[ns]')
+
+        if verbose:
+            print("\n[GENERATING] Generating samples...")
+
+        # Every grid cell sees the same window × sample sequence, so gather it once
+        window_idx = np.repeat(np.arange(n_windows, dtype=np.int32), samples_per_grid)
+        window_block = {k: v[window_idx] for k, v in window_cols.items()}
+
+        step = grids_per_chunk or n_grids
+        for first in range(0, n_grids, step):
+            grids = np.arange(first, min(first + step, n_grids), dtype=np.int32)
+            n = len(grids) * len(window_idx)
+
+            # Broadcast grid × window × sample into flat arrays of length n
+            grid_idx = np.repeat(grids, len(window_idx))
+            g = {k: v[grid_idx] for k, v in grid_cols.items()}
+            w = {k: np.tile(v, len(grids)) for k, v in window_block.items()}
+            region_idx = g['region_idx']
+
+            # Regional hazard draws (inverse CDF over per-region cumulative weights)
+            u = self.rng.random(n, dtype=np.float32)
+            hazard_idx = (self.hazard_cum[region_idx] <= u[:, None]).sum(axis=1, dtype=np.int8)
+
+            ocean_features = {col: np.empty(n, dtype=np.float32) for col in OCEAN_FEATURES}
+            self._generate_oceanographic_features(
+                w['month'], region_idx, hazard_idx, g['lat_offset'], g['is_gujarat'], *ocean_features.values())
+
+            seasonal_risk = SEASONAL_RISK_LUT[hazard_idx, region_idx, w['season_idx']]
+
+            final_risk = np.empty(n, dtype=np.float32)
+            bin_idx = np.empty(n, dtype=np.int8)
+            severity_idx = np.empty(n, dtype=np.int8)
+            _score_kernel(
+                ocean_features['sst_celsius'], ocean_features['wave_height_m'], ocean_features['wind_speed_kmh'],
+                g['bathymetry_depth_m'], g['coastal_slope_deg'],
+                BASE_RISK[hazard_idx].astype(np.float32), seasonal_risk,
+                self._normal(0.05, n), final_risk, bin_idx, severity_idx)
+
+            yield pd.DataFrame({
+                'cell_id': pd.Categorical.from_codes(grid_idx, categories=cell_ids),
+                'lat': g['lat'],
+                'lng': g['lng'],
+                'sea_region': pd.Categorical.from_codes(region_idx, categories=SEA_REGIONS),
+                'timestamp': w['timestamp'],
+                'year': w['year'],
+                'month': w['month'],
+                'day_of_year': w['day_of_year'],
+                'season': pd.Categorical.from_codes(w['season_idx'], categories=SEASONS),
+                'is_monsoon': w['is_monsoon'],
+                'is_cyclone_season': w['is_cyclone_season'],
+                **ocean_features,
+                'bathymetry_depth_m': g['bathymetry_depth_m'],
+                'coastal_slope_deg': g['coastal_slope_deg'],
+                'tidal_range_m': g['tidal_range_m'],
+                'hazard_type': pd.Categorical.from_codes(hazard_idx, categories=HAZARD_TYPES),
+                'risk_score': np.round(final_risk, 4),
+                'seasonal_risk_multiplier': np.round(seasonal_risk, 3),
+                'severity': pd.Categorical.from_codes(severity_idx, categories=SEVERITY_LEVELS),
+                'intensity_bin': pd.Categorical.from_codes(bin_idx, categories=INTENSITY_BINS),
+            })
+
+    def generate_expanded_dataset(self, samples_per_grid=3, temporal_sampling_rate=0.15,
+                                  verbose=None) -> pd.DataFrame:
+        """
+        Generate massively expanded all-India training dataset.
+        verbose=False skips the progress output and the summary scans over the frame
+        (None uses the engineer's setting).
+        """
+        verbose = self.verbose if verbose is None else verbose
+        if verbose:
+            print("\n" + "=" * 70)
+            print("[DATA ENGINEERING] All-India Advanced Data Pipeline")
+            print("=" * 70)
+
+        df = next(self.iter_expanded_chunks(samples_per_grid, temporal_sampling_rate, verbose=verbose))
+        if not verbose:
+            return df
 
         print(f"\n[SUCCESS] Generated {len(df):,} training samples")
         print(f"   Unique grid cells: {df['cell_id'].nunique()}")
@@ -344,9 +517,33 @@ class AdvancedCoastalDataEngineer:
 
         return df
 
+    def write_expanded_dataset(self, path, samples_per_grid=3, temporal_sampling_rate=0.15,
+                               grids_per_chunk=25, verbose=None) -> int:
+        """Stream the expanded dataset to a zstd Parquet file chunk by chunk; returns the row count."""
+        verbose = self.verbose if verbose is None else verbose
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        rows = 0
+        writer = None
+        try:
+            for chunk in self.iter_expanded_chunks(samples_per_grid, temporal_sampling_rate, grids_per_chunk, verbose):
+                table = pa.Table.from_pandas(chunk, preserve_index=False)
+                if writer is None:
+                    writer = pq.ParquetWriter(path, table.schema, compression='zstd')
+                writer.write_table(table)
+                rows += len(chunk)
+        finally:
+            if writer is not None:
+                writer.close()
+
+        if verbose:
+            print(f"\n[SUCCESS] Wrote {rows:,} training samples")
+        return rows
+
 
 if __name__ == '__main__':
     engineer = AdvancedCoastalDataEngineer()
-    df = engineer.generate_expanded_dataset(samples_per_grid=3, temporal_sampling_rate=0.15)
-    df.to_csv('data/expanded_coastal_training.csv', index=False)
-    print(f"\n[SAVED] Saved to data/expanded_coastal_training.csv")
+    engineer.write_expanded_dataset('data/expanded_coastal_training.parquet',
+                                    samples_per_grid=3, temporal_sampling_rate=0.15)
+    print(f"\n[SAVED] Saved to data/expanded_coastal_training.parquet")
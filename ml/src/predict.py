@@ -6,13 +6,82 @@ Trained on expanded all-India dataset with temporal+spatial+oceanographic featur
 
 import numpy as np
 import pandas as pd
+from numpy.random import default_rng, SFC64
 import os
 from datetime import datetime
-from typing import Dict, List, Tuple
-from sklearn.ensemble import RandomForestClassifier, GradientBoostingRegressor
+from typing import Dict, List, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from sklearn.ensemble import RandomForestClassifier, HistGradientBoostingRegressor
+from sklearn.inspection import permutation_importance
 from sklearn.preprocessing import LabelEncoder
 from sklearn.model_selection import cross_val_score
-import pickle
+import joblib
+
+SEA_REGIONS = np.array(['Bay of Bengal', 'Arabian Sea', 'Andaman Sea'], dtype=object)
+BAY_OF_BENGAL, ARABIAN_SEA, ANDAMAN = range(3)
+
+# Calendar lookups indexed by month number (index 0 unused)
+MONSOON_BY_MONTH = np.isin(np.arange(13), [6, 7, 8, 9])
+WINTER_BY_MONTH = np.isin(np.arange(13), [12, 1, 2])
+CYCLONE_SEASON_BY_MONTH = np.isin(np.arange(13), [4, 5, 10, 11, 12])
+SEASON_BY_MONTH = np.array(['', 'winter', 'winter', 'summer', 'summer', 'summer', 'monsoon',
+                            'monsoon', 'monsoon', 'monsoon', 'post_monsoon', 'post_monsoon', 'winter'],
+                           dtype=object)
+
+# Regional offsets on the seasonal SST / wave baselines (indexed by SEA_REGIONS)
+OCEAN_REGION_SST = np.array([0.5, 0.0, 1.0])
+OCEAN_REGION_WAVE = np.array([0.2, 0.0, 0.5])
+
+# Hazard mix sampled by predict_multiple_locations: cumulative weights per SEA_REGIONS row
+HAZARD_TYPES = np.array(['tsunami', 'cyclone', 'storm_surge', 'high_tide',
+                         'coastal_flood', 'rip_current', 'erosion'], dtype=object)
+HAZARD_CUM_WEIGHTS = np.cumsum([
+    [0.05, 0.30, 0.25, 0.10, 0.10, 0.12, 0.08],
+    [0.02, 0.18, 0.22, 0.15, 0.15, 0.15, 0.13],
+    [0.15, 0.18, 0.15, 0.08, 0.07, 0.25, 0.12],
+], axis=1)
+
+
+# Affected-area bounding boxes (lat_min, lat_max, lng_min, lng_max), first match wins
+AFFECTED_AREA_BOXES = np.array([
+    [22.0, 23.5, 87.0, 89.0],
+    [21.0, 22.0, 86.5, 88.0],
+    [19.5, 21.0, 84.5, 87.5],
+    [17.0, 19.5, 82.0, 84.5],
+    [15.0, 17.0, 80.0, 82.5],
+    [12.5, 15.0, 79.5, 80.5],
+    [10.5, 12.5, 79.0, 80.5],
+    [8.0, 10.5, 77.0, 80.0],
+    [8.0, 10.0, 76.0, 77.0],
+    [10.0, 12.5, 75.0, 76.5],
+    [12.5, 14.0, 74.0, 75.5],
+    [14.0, 16.0, 73.5, 74.5],
+    [16.0, 19.0, 72.5, 74.0],
+    [18.5, 20.0, 72.0, 73.5],
+    [20.0, 24.0, 68.0, 73.0],
+    [6.0, 14.0, 91.0, 95.0],
+    [8.0, 12.0, 71.0, 74.0],
+], dtype=np.float32)
+AFFECTED_AREA_NAMES = np.array([
+    'Sundarbans / West Bengal Coast',
+    'Digha / West Bengal Coast',
+    'Odisha Coast',
+    'Andhra Pradesh Coast',
+    'Andhra Pradesh South Coast',
+    'Chennai Metropolitan Area',
+    'Tamil Nadu Central Coast',
+    'Tamil Nadu South Coast',
+    'Kerala South Coast',
+    'Kerala Central Coast',
+    'Karnataka Coast',
+    'Goa Coast',
+    'Maharashtra Coast',
+    'Mumbai Metropolitan Coast',
+    'Gujarat Coast',
+    'Andaman & Nicobar Islands',
+    'Lakshadweep Islands',
+], dtype=object)
+
 
 class EnhancedHazardPredictor:
     """
@@ -23,12 +92,16 @@ class EnhancedHazardPredictor:
 
     def __init__(self, data_dir='data'):
         self.data_dir = data_dir
+        self.rng = default_rng(SFC64())
         self.risk_model = None
         self.severity_model = None
         self.intensity_model = None
         self.label_encoders = {}
         self.feature_columns = []
+        self.feature_importances = None
         self.is_trained = False
+        # The three models are independent at predict time; run them side by side
+        self._pool = ThreadPoolExecutor(max_workers=3, thread_name_prefix='predict')
         self.load_models()
 
     def train(self, training_data: pd.DataFrame):
@@ -38,12 +111,17 @@ class EnhancedHazardPredictor:
         print("=" * 70)
         print(f"\n[DATA] Shape: {training_data.shape}")
 
-        # Encode categorical features
+        # Encode categorical features (kept as arrays; the input frame is not modified).
+        # pd.factorize(sort=True) on the raw values gives LabelEncoder's sorted codes via a
+        # hash table; a LabelEncoder carrying those classes_ is stored for prediction.
         categorical_cols = ['sea_region', 'hazard_type', 'season', 'severity', 'intensity_bin']
+        encoded = {}
         for col in categorical_cols:
             if col in training_data.columns:
+                codes, classes = pd.factorize(training_data[col].to_numpy(), sort=True)
                 self.label_encoders[col] = LabelEncoder()
-                training_data[f'{col}_encoded'] = self.label_encoders[col].fit_transform(training_data[col])
+                self.label_encoders[col].classes_ = np.asarray(classes)
+                encoded[f'{col}_encoded'] = codes
 
         # 17 features: spatial(2) + temporal(4) + ocean(5) + geological(3) + categorical(3)
         self.feature_columns = [
@@ -54,25 +132,27 @@ class EnhancedHazardPredictor:
             'sea_region_encoded', 'hazard_type_encoded', 'season_encoded',
         ]
 
-        X = training_data[self.feature_columns].values
+        X = np.empty((len(training_data), len(self.feature_columns)), dtype=np.float32)
+        for j, col in enumerate(self.feature_columns):
+            X[:, j] = encoded[col] if col in encoded else training_data[col].to_numpy()
         y_risk = training_data['risk_score'].values
-        y_severity = training_data['severity_encoded'].values
-        y_intensity = training_data['intensity_bin_encoded'].values
+        y_severity = encoded['severity_encoded']
+        y_intensity = encoded['intensity_bin_encoded']
 
         print(f"   Features: {len(self.feature_columns)}")
         print(f"   Samples: {X.shape[0]:,}")
 
-        # Risk Score Model (Gradient Boosting)
+        # Risk Score Model (histogram Gradient Boosting)
         print("\n[MODEL 1] Risk score regression (Gradient Boosting)...")
-        self.risk_model = GradientBoostingRegressor(
-            n_estimators=250, max_depth=8, learning_rate=0.1,
-            subsample=0.8, random_state=42)
+        self.risk_model = HistGradientBoostingRegressor(
+            max_iter=250, max_depth=8, learning_rate=0.1, random_state=42)
         self.risk_model.fit(X, y_risk)
         r2 = self.risk_model.score(X, y_risk)
         print(f"   R² = {r2:.4f}")
 
-        # Cross-validation
-        cv_scores = cross_val_score(self.risk_model, X, y_risk, cv=5, scoring='r2')
+        # Cross-validation (logged only): 3 folds on a fixed 20% subsample capped at 50k rows
+        cv_rows = np.random.default_rng(42).permutation(len(X))[:min(len(X) // 5, 50_000)]
+        cv_scores = cross_val_score(self.risk_model, X[cv_rows], y_risk[cv_rows], cv=3, scoring='r2')
         print(f"   CV R² = {cv_scores.mean():.4f} ± {cv_scores.std():.4f}")
 
         # Severity Classification Model
@@ -80,7 +160,7 @@ class EnhancedHazardPredictor:
         self.severity_model = RandomForestClassifier(
             n_estimators=200, max_depth=12, min_samples_split=5,
             random_state=42, n_jobs=-1)
-        self.severity_model.fit(X, y_severity)
+        self._fit_forest(self.severity_model, X, y_severity)
         acc = self.severity_model.score(X, y_severity)
         print(f"   Accuracy = {acc:.4f}")
 
@@ -88,171 +168,252 @@ class EnhancedHazardPredictor:
         print("\n[MODEL 3] Intensity classification (Random Forest)...")
         self.intensity_model = RandomForestClassifier(
             n_estimators=200, max_depth=10, random_state=42, n_jobs=-1)
-        self.intensity_model.fit(X, y_intensity)
+        self._fit_forest(self.intensity_model, X, y_intensity)
         int_acc = self.intensity_model.score(X, y_intensity)
         print(f"   Accuracy = {int_acc:.4f}")
 
-        # Feature importance
+        # Feature importance (HistGradientBoosting has no impurity importances, so use
+        # permutation importance on a subsample, clipped at 0 and normalized to sum to 1)
+        perm = permutation_importance(self.risk_model, X, y_risk, n_repeats=3,
+                                      max_samples=min(5000, len(X)), random_state=42)
+        importances = np.clip(perm.importances_mean, 0.0, None)
+        self.feature_importances = importances / max(importances.sum(), 1e-12)
+
         print("\n[FEATURES] Top 10 Important Features (Risk):")
-        fi = pd.DataFrame({
-            'feature': self.feature_columns,
-            'importance': self.risk_model.feature_importances_
-        }).sort_values('importance', ascending=False).head(10)
-        for _, row in fi.iterrows():
-            bar = "#" * int(row['importance'] * 50)
-            print(f"   {row['feature']:.<30} {row['importance']:.4f} {bar}")
+        for i in np.argsort(-self.feature_importances, kind='stable')[:10]:
+            importance = self.feature_importances[i]
+            bar = "#" * int(importance * 50)
+            print(f"   {self.feature_columns[i]:.<30} {importance:.4f} {bar}")
 
+        self._set_inference_jobs()
         self.is_trained = True
         self.save_models()
         print("\n" + "=" * 70)
         print("[SUCCESS] All-India Model Training Complete!")
         print("=" * 70)
 
+    def _fit_forest(self, forest: RandomForestClassifier, X: np.ndarray, y: np.ndarray,
+                    min_trees: int = 50, step: int = 25, tolerance: float = 0.005):
+        """
+        Grow the forest from `min_trees` in steps of `step` trees up to its n_estimators, tracking
+        the out-of-bag accuracy, then keep the smallest prefix of trees whose OOB score is within
+        `tolerance` (relative, 0.005 = 0.5%) of the best. Smaller forests leave some rows without
+        an OOB estimate, so they are not candidates.
+        """
+        max_trees = forest.n_estimators
+        forest.set_params(warm_start=True, oob_score=True)
+        sizes, scores = [], []
+        for n in range(min(min_trees, max_trees), max_trees + 1, step):
+            forest.set_params(n_estimators=n)
+            forest.fit(X, y)
+            sizes.append(n)
+            scores.append(forest.oob_score_)
+
+        best = next(n for n, sc in zip(sizes, scores) if sc >= (1 - tolerance) * max(scores))
+        forest.estimators_ = forest.estimators_[:best]
+        forest.set_params(n_estimators=best, warm_start=False, oob_score=False)
+        # The OOB arrays describe the full forest and would bloat the saved model
+        del forest.oob_score_, forest.oob_decision_function_
+        print(f"   Trees = {best}/{max_trees} (OOB = {scores[sizes.index(best)]:.4f}, best {max(scores):.4f})")
+
     def save_models(self):
         os.makedirs(self.data_dir, exist_ok=True)
         path = os.path.join(self.data_dir, 'trained_models_enhanced.pkl')
-        with open(path, 'wb') as f:
-            pickle.dump({
-                'risk_model': self.risk_model,
-                'severity_model': self.severity_model,
-                'intensity_model': self.intensity_model,
-                'label_encoders': self.label_encoders,
-                'feature_columns': self.feature_columns,
-            }, f)
+        # zlib level 3 shrinks the forests' node arrays ~4x for a ~0.1 s slower load
+        joblib.dump({
+            'risk_model': self.risk_model,
+            'severity_model': self.severity_model,
+            'intensity_model': self.intensity_model,
+            'label_encoders': self.label_encoders,
+            'feature_columns': self.feature_columns,
+            'feature_importances': self.feature_importances,
+        }, path, compress=3)
         print(f"[SAVED] Models -> {path}")
 
     def load_models(self):
         path = os.path.join(self.data_dir, 'trained_models_enhanced.pkl')
         if os.path.exists(path):
             print(f"[LOADING] Models from {path}")
-            with open(path, 'rb') as f:
-                data = pickle.load(f)
-                self.risk_model = data['risk_model']
-                self.severity_model = data['severity_model']
-                self.intensity_model = data['intensity_model']
-                self.label_encoders = data['label_encoders']
-                self.feature_columns = data['feature_columns']
-                self.is_trained = True
+            # joblib also reads the plain-pickle files written by older versions
+            data = joblib.load(path)
+            self.risk_model = data['risk_model']
+            self.severity_model = data['severity_model']
+            self.intensity_model = data['intensity_model']
+            self.label_encoders = data['label_encoders']
+            self.feature_columns = data['feature_columns']
+            # Older model files predate stored importances (their risk model exposes them)
+            self.feature_importances = data.get('feature_importances')
+            if self.feature_importances is None:
+                self.feature_importances = self.risk_model.feature_importances_
+            self._set_inference_jobs()
+            self.is_trained = True
             print("[OK] Models loaded")
         else:
             print("[INFO] No pre-trained models found.")
 
+    def _set_inference_jobs(self):
+        """Predict each forest single-threaded: models already run concurrently on self._pool, and
+        per-call joblib dispatch across all cores costs more than small request batches."""
+        self.severity_model.n_jobs = 1
+        self.intensity_model.n_jobs = 1
+
     def _get_sea_region(self, lat: float, lng: float) -> str:
         if lng > 90: return 'Andaman Sea'
         elif lng > 77: return 'Bay of Bengal'
         else: return 'Arabian Sea'
 
-    def _estimate_oceanographic_conditions(self, lat, lng, hazard_type='storm_surge') -> Dict:
-        """Estimate current oceanographic conditions for prediction."""
-        month = datetime.now().month
-        sea_region = self._get_sea_region(lat, lng)
-
-        if month in [6, 7, 8, 9]:
-            sst, wave, wind = 29.0, 3.0, 22.0
-        elif month in [12, 1, 2]:
-            sst, wave, wind = 26.5, 1.5, 12.0
-        else:
-            sst, wave, wind = 30.0, 2.0, 15.0
+    def _sea_region_ids(self, lngs: np.ndarray) -> np.ndarray:
+        """Vectorized _get_sea_region: int codes into SEA_REGIONS."""
+        return np.select([lngs > 90, lngs > 77], [ANDAMAN, BAY_OF_BENGAL], ARABIAN_SEA)
 
-        if sea_region == 'Bay of Bengal': sst += 0.5; wave += 0.2
-        elif sea_region == 'Andaman Sea': sst += 1.0; wave += 0.5
+    def _estimate_oceanographic_conditions(self, lats: np.ndarray, region: np.ndarray, months: np.ndarray,
+                                           noise: np.ndarray) -> Dict[str, np.ndarray]:
+        """Estimate oceanographic conditions for arrays of locations (sea-region codes) and months."""
+        monsoon, winter = MONSOON_BY_MONTH[months], WINTER_BY_MONTH[months]
+        sst = np.select([monsoon, winter], [29.0, 26.5], 30.0) + OCEAN_REGION_SST[region]
+        wave = np.select([monsoon, winter], [3.0, 1.5], 2.0) + OCEAN_REGION_WAVE[region]
+        wind = np.select([monsoon, winter], [22.0, 12.0], 15.0)
 
         # Gujarat tidal extremes
-        if sea_region == 'Arabian Sea' and lat > 20:
-            tide = 4.0 + np.random.normal(0, 0.5)
-        else:
-            tide = 0.8 + np.random.normal(0, 0.3)
+        gujarat = (region == ARABIAN_SEA) & (lats > 20)
+        tide = np.where(gujarat, 4.0, 0.8)
+        tide_sd = np.where(gujarat, 0.5, 0.3)
 
         return {
-            'sst_celsius': np.clip(sst + np.random.normal(0, 0.5), 24.0, 33.0),
-            'wave_height_m': np.clip(wave + np.random.normal(0, 0.4), 0.3, 8.0),
-            'wind_speed_kmh': np.clip(wind + np.random.normal(0, 3.0), 2.0, 55.0),
-            'current_velocity_ms': np.clip(0.8 + np.random.normal(0, 0.3), 0.05, 3.0),
-            'tide_level_m': np.clip(tide, -1.0, 6.0),
+            'sst_celsius': np.clip(sst + 0.5 * noise[0], 24.0, 33.0),
+            'wave_height_m': np.clip(wave + 0.4 * noise[1], 0.3, 8.0),
+            'wind_speed_kmh': np.clip(wind + 3.0 * noise[2], 2.0, 55.0),
+            'current_velocity_ms': np.clip(0.8 + 0.3 * noise[3], 0.05, 3.0),
+            'tide_level_m': np.clip(tide + tide_sd * noise[4], -1.0, 6.0),
         }
 
-    def _estimate_geological_features(self, lat, lng) -> Dict:
-        """Estimate geological features for a location."""
-        sea_region = self._get_sea_region(lat, lng)
-
-        if sea_region == 'Arabian Sea' and lat > 20:
-            bathy, slope, tidal = 15.0, 1.5, 8.0
-        elif sea_region == 'Andaman Sea':
-            bathy, slope, tidal = 120.0, 3.5, 1.5
-        elif sea_region == 'Bay of Bengal' and lat > 20:
-            bathy, slope, tidal = 25.0, 2.0, 4.5
-        else:
-            bathy, slope, tidal = 40.0, 2.5, 1.5
+    def _estimate_geological_features(self, lats: np.ndarray, region: np.ndarray,
+                                      noise: np.ndarray) -> Dict[str, np.ndarray]:
+        """Estimate geological features for arrays of locations (sea-region codes)."""
+        conds = [
+            (region == ARABIAN_SEA) & (lats > 20),
+            region == ANDAMAN,
+            (region == BAY_OF_BENGAL) & (lats > 20),
+        ]
+        bathy = np.select(conds, [15.0, 120.0, 25.0], 40.0)
+        slope = np.select(conds, [1.5, 3.5, 2.0], 2.5)
+        tidal = np.select(conds, [8.0, 1.5, 4.5], 1.5)
 
         return {
-            'bathymetry_depth_m': bathy + np.random.normal(0, 5),
-            'coastal_slope_deg': max(0.5, slope + np.random.normal(0, 0.5)),
-            'tidal_range_m': max(0.3, tidal + np.random.normal(0, 0.3)),
+            'bathymetry_depth_m': bathy + 5.0 * noise[0],
+            'coastal_slope_deg': np.maximum(0.5, slope + 0.5 * noise[1]),
+            'tidal_range_m': np.maximum(0.3, tidal + 0.3 * noise[2]),
         }
 
     def predict_risk(self, lat: float, lng: float, hazard_type: str = 'storm_surge') -> Dict:
         """Generate prediction for ANY location along the Indian coast."""
+        return self.predict_batch([lat], [lng], [hazard_type])[0]
+
+    def _build_features(self, lats: np.ndarray, lngs: np.ndarray, hazard_types: List[str],
+                        timestamps: Optional[List[datetime]]) -> Tuple[Dict, np.ndarray]:
+        """
+        Assemble the (n, 17) feature matrix and per-column response context for a batch of queries.
+        With no timestamps every row is stamped now, and its calendar fields are derived once.
+        """
+        n = len(lats)
+        if timestamps is None:
+            now = datetime.now()
+            month = np.full(n, now.month)
+            day_of_year = np.full(n, now.timetuple().tm_yday)
+            iso_times = [now.isoformat()] * n
+        else:
+            month = np.array([ts.month for ts in timestamps])
+            day_of_year = np.array([ts.timetuple().tm_yday for ts in timestamps])
+            iso_times = [ts.isoformat() for ts in timestamps]
+        is_monsoon = MONSOON_BY_MONTH[month]
+        is_cyclone_season = CYCLONE_SEASON_BY_MONTH[month]
+        season = SEASON_BY_MONTH[month]
+
+        region = self._sea_region_ids(lngs)
+        sea_region = SEA_REGIONS[region]
+        # One draw covers the 5 oceanographic and 3 geological jitter rows
+        noise = self.rng.standard_normal((8, n))
+        ocean = self._estimate_oceanographic_conditions(lats, region, month, noise[:5])
+        geo = self._estimate_geological_features(lats, region, noise[5:])
+
+        # Encode against the fitted classes in one pass per column; a row with any
+        # unseen value falls back to all-zero codes
+        try:
+            encoded = np.column_stack([
+                pd.Categorical(values, categories=self.label_encoders[col].classes_).codes
+                for col, values in (('sea_region', sea_region), ('hazard_type', hazard_types), ('season', season))
+            ])
+            encoded[(encoded < 0).any(axis=1)] = 0
+        except KeyError:
+            encoded = np.zeros((n, 3), dtype=np.int8)
+
+        features = np.stack([
+            lats, lngs, month, day_of_year, is_monsoon, is_cyclone_season,
+            *ocean.values(), *geo.values(), *encoded.T,
+        ], axis=1, dtype=np.float32)
+        ctx = {
+            'hazard_type': hazard_types, 'lat': lats, 'lng': lngs, 'timestamp': iso_times,
+            'sea_region': sea_region, 'season': season, 'ocean': ocean, 'geo': geo,
+            'affected_area': self._get_affected_areas(lats, lngs),
+        }
+        return ctx, features
+
+    def predict_batch(self, lats: List[float], lngs: List[float], hazard_types: List[str],
+                      timestamps: Optional[List[datetime]] = None) -> List[Dict]:
+        """
+        Predict many (lat, lng, hazard_type[, timestamp]) queries with one call per model.
+        Timestamps default to now for every query.
+        """
         if not self.is_trained:
             raise ValueError("Models not trained!")
+        if len(lats) == 0:
+            return []
+
+        ctx, features = self._build_features(
+            np.asarray(lats, dtype=np.float64), np.asarray(lngs, dtype=np.float64), list(hazard_types), timestamps)
+
+        # sklearn's tree traversal releases the GIL, so the model calls overlap on the pool
+        risk_f = self._pool.submit(self.risk_model.predict, features)
+        proba_f = self._pool.submit(self.severity_model.predict_proba, features)
+        intensity_f = self._pool.submit(self.intensity_model.predict, features)
+
+        # One severity forest pass: the class is the argmax of its probabilities (as in predict)
+        risk_scores = np.clip(risk_f.result(), 0.0, 1.0)
+        severity_proba = proba_f.result()
+        severity_codes = self.severity_model.classes_[severity_proba.argmax(axis=1)]
+        severities = self.label_encoders['severity'].classes_[severity_codes]
+        intensity_bins = self.label_encoders['intensity_bin'].classes_[intensity_f.result()]
+        confidences = np.clip(severity_proba.max(axis=1), 0.6, 0.98)
+
+        # Top contributing factors for every row at once: |value * importance|, largest first
+        contribs = np.abs(features * self.feature_importances)
+        top_idx = np.argsort(-contribs, axis=1, kind='stable')[:, :3]
+
+        return [
+            self._format_prediction(ctx, i, float(risk), sev, intens, float(conf),
+                                    [(self.feature_columns[j], contribs[i, j]) for j in top])
+            for i, (risk, sev, intens, conf, top)
+            in enumerate(zip(risk_scores, severities, intensity_bins, confidences, top_idx))
+        ]
 
-        now = datetime.now()
-        month = now.month
-        day_of_year = now.timetuple().tm_yday
-        is_monsoon = 1 if month in [6, 7, 8, 9] else 0
-        is_cyclone_season = 1 if month in [4, 5, 10, 11, 12] else 0
-
-        if month in [12, 1, 2]: season = 'winter'
-        elif month in [3, 4, 5]: season = 'summer'
-        elif month in [6, 7, 8, 9]: season = 'monsoon'
-        else: season = 'post_monsoon'
-
-        sea_region = self._get_sea_region(lat, lng)
-        ocean = self._estimate_oceanographic_conditions(lat, lng, hazard_type)
-        geo = self._estimate_geological_features(lat, lng)
-
-        try:
-            sr_enc = self.label_encoders['sea_region'].transform([sea_region])[0]
-            ht_enc = self.label_encoders['hazard_type'].transform([hazard_type])[0]
-            se_enc = self.label_encoders['season'].transform([season])[0]
-        except (ValueError, KeyError):
-            sr_enc, ht_enc, se_enc = 0, 0, 0
-
-        features = np.array([[
-            lat, lng, month, day_of_year, is_monsoon, is_cyclone_season,
-            ocean['sst_celsius'], ocean['wave_height_m'], ocean['wind_speed_kmh'],
-            ocean['current_velocity_ms'], ocean['tide_level_m'],
-            geo['bathymetry_depth_m'], geo['coastal_slope_deg'], geo['tidal_range_m'],
-            sr_enc, ht_enc, se_enc,
-        ]])
-
-        risk_score = float(np.clip(self.risk_model.predict(features)[0], 0.0, 1.0))
-        severity_enc = self.severity_model.predict(features)[0]
-        severity = self.label_encoders['severity'].inverse_transform([severity_enc])[0]
-        intensity_enc = self.intensity_model.predict(features)[0]
-        intensity_bin = self.label_encoders['intensity_bin'].inverse_transform([intensity_enc])[0]
-
-        severity_probs = self.severity_model.predict_proba(features)[0]
-        confidence = float(np.clip(np.max(severity_probs), 0.6, 0.98))
-
-        # Top contributing factors
-        feature_contribs = list(zip(self.feature_columns, features[0]))
-        top_factors = sorted(
-            [(name, abs(val * self.risk_model.feature_importances_[i]))
-             for i, (name, val) in enumerate(feature_contribs)],
-            key=lambda x: x[1], reverse=True
-        )[:3]
+    def _format_prediction(self, ctx: Dict, i: int, risk_score: float, severity: str,
+                           intensity_bin: str, confidence: float, top_factors: List[Tuple[str, float]]) -> Dict:
+        """Shape row i of the batch model output into the API response dict."""
+        ocean = {k: float(v[i]) for k, v in ctx['ocean'].items()}
+        geo = {k: float(v[i]) for k, v in ctx['geo'].items()}
+        lat, lng = float(ctx['lat'][i]), float(ctx['lng'][i])
 
         return {
-            'hazardType': hazard_type,
+            'hazardType': ctx['hazard_type'][i],
             'riskScore': round(risk_score, 3),
             'confidence': round(confidence, 3),
             'severity': severity,
             'intensityBin': intensity_bin,
-            'affectedArea': self._get_affected_area(lat, lng),
-            'seaRegion': sea_region,
-            'season': season,
+            'affectedArea': ctx['affected_area'][i],
+            'seaRegion': ctx['sea_region'][i],
+            'season': str(ctx['season'][i]),
             'lat': lat, 'lng': lng,
-            'timestamp': now.isoformat(),
+            'timestamp': ctx['timestamp'][i],
             'oceanographicConditions': {
                 'sst': round(ocean['sst_celsius'], 2),
                 'waveHeight': round(ocean['wave_height_m'], 2),
@@ -274,50 +435,28 @@ class EnhancedHazardPredictor:
 
     def _get_affected_area(self, lat: float, lng: float) -> str:
         """Determine affected area from coordinates — covers ALL of India."""
-        areas = [
-            (22.0, 23.5, 87.0, 89.0, 'Sundarbans / West Bengal Coast'),
-            (21.0, 22.0, 86.5, 88.0, 'Digha / West Bengal Coast'),
-            (19.5, 21.0, 84.5, 87.5, 'Odisha Coast'),
-            (17.0, 19.5, 82.0, 84.5, 'Andhra Pradesh Coast'),
-            (15.0, 17.0, 80.0, 82.5, 'Andhra Pradesh South Coast'),
-            (12.5, 15.0, 79.5, 80.5, 'Chennai Metropolitan Area'),
-            (10.5, 12.5, 79.0, 80.5, 'Tamil Nadu Central Coast'),
-            (8.0, 10.5, 77.0, 80.0, 'Tamil Nadu South Coast'),
-            (8.0, 10.0, 76.0, 77.0, 'Kerala South Coast'),
-            (10.0, 12.5, 75.0, 76.5, 'Kerala Central Coast'),
-            (12.5, 14.0, 74.0, 75.5, 'Karnataka Coast'),
-            (14.0, 16.0, 73.5, 74.5, 'Goa Coast'),
-            (16.0, 19.0, 72.5, 74.0, 'Maharashtra Coast'),
-            (18.5, 20.0, 72.0, 73.5, 'Mumbai Metropolitan Coast'),
-            (20.0, 24.0, 68.0, 73.0, 'Gujarat Coast'),
-            (6.0, 14.0, 91.0, 95.0, 'Andaman & Nicobar Islands'),
-            (8.0, 12.0, 71.0, 74.0, 'Lakshadweep Islands'),
-        ]
+        return self._get_affected_areas(np.array([lat]), np.array([lng]))[0]
 
-        for lat_min, lat_max, lng_min, lng_max, name in areas:
-            if lat_min <= lat <= lat_max and lng_min <= lng <= lng_max:
-                return name
-        return 'Indian Coastal Region'
+    def _get_affected_areas(self, lats: np.ndarray, lngs: np.ndarray) -> np.ndarray:
+        """Vectorized _get_affected_area: first matching box per point, else the generic region."""
+        lat_min, lat_max, lng_min, lng_max = AFFECTED_AREA_BOXES.T
+        hit = ((lats[:, None] >= lat_min) & (lats[:, None] <= lat_max) &
+               (lngs[:, None] >= lng_min) & (lngs[:, None] <= lng_max))
+        return np.where(hit.any(axis=1), AFFECTED_AREA_NAMES[hit.argmax(axis=1)], 'Indian Coastal Region')
 
     def predict_multiple_locations(self, locations: List[Tuple[float, float]]) -> List[Dict]:
-        """Generate predictions for multiple locations."""
-        hazard_types = ['tsunami', 'cyclone', 'storm_surge', 'high_tide',
-                        'coastal_flood', 'rip_current', 'erosion']
-        predictions = []
-
-        for lat, lng in locations:
-            sr = self._get_sea_region(lat, lng)
-            if sr == 'Bay of Bengal':
-                weights = [0.05, 0.30, 0.25, 0.10, 0.10, 0.12, 0.08]
-            elif sr == 'Andaman Sea':
-                weights = [0.15, 0.18, 0.15, 0.08, 0.07, 0.25, 0.12]
-            else:
-                weights = [0.02, 0.18, 0.22, 0.15, 0.15, 0.15, 0.13]
-
-            hazard = np.random.choice(hazard_types, p=weights)
-            predictions.append(self.predict_risk(lat, lng, hazard))
-
-        return predictions
+        """Generate predictions for multiple locations in a single batched model call."""
+        if len(locations) == 0:
+            return []
+        lats, lngs = np.asarray(locations, dtype=np.float64).T
+
+        # Inverse-CDF sample one hazard per location from its region's mix in a single draw
+        # (comparing against the first 6 cut points keeps the index in range despite rounding)
+        cum = HAZARD_CUM_WEIGHTS[self._sea_region_ids(lngs), :-1]
+        u = self.rng.random(len(lats))
+        hazards = HAZARD_TYPES[(cum <= u[:, None]).sum(axis=1)]
+
+        return self.predict_batch(lats, lngs, list(hazards))
 
 
 if __name__ == '__main__':
@@ -0,0 +1,21 @@
+"""
+Offline training entrypoint for the SeaTrace ML service.
+Generates the all-India dataset, trains the models and saves them to data/.
+Run from ml/:  python src/train.py
+"""
+
+from data_engineering import AdvancedCoastalDataEngineer
+from predict import EnhancedHazardPredictor
+
+
+def main(data_dir='data'):
+    engineer = AdvancedCoastalDataEngineer()
+    df = engineer.generate_expanded_dataset(samples_per_grid=3, temporal_sampling_rate=0.15)
+
+    predictor = EnhancedHazardPredictor(data_dir=data_dir)
+    predictor.train(df)
+    return predictor
+
+
+if __name__ == '__main__':
+    main()
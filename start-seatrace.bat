@@ -33,7 +33,7 @@ echo     MongoDB is ready!
 REM Train ML models if not already trained
 echo.
 echo [2/4] Checking ML models...
-if not exist "ml\data\trained_models.pkl" (
+if not exist "ml\data\trained_models_enhanced.pkl" (
     echo     No trained models found. Training now...
     call train-models.bat
 ) else (
@@ -18,7 +18,7 @@ echo This will take 30-60 seconds...
 echo.
 
 REM Train the models
-python src/predict.py
+python src/train.py
 
 if errorlevel 1 (
     echo.
@@ -37,7 +37,7 @@ echo ============================================================
 echo ML Model Training Complete!
 echo ============================================================
 echo.
-echo Models saved to ml/data/trained_models.pkl
+echo Models saved to ml/data/trained_models_enhanced.pkl
 echo Ready to make predictions on Indian coastal hazards!
 echo.
 pause